@@ -5,9 +5,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Iterable
 
@@ -21,6 +24,9 @@ DEFAULT_BENCHMARK_NAME = "terminal_bench_2"
 DEFAULT_ADAPTER_ID = "harbor_tb2"
 DEFAULT_SPLIT = "test"
 
+_INT_RE = re.compile(r"-?[0-9]+")
+_TASK_ID_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
 
 @dataclass(frozen=True)
 class ExportConfig:
@@ -35,11 +41,7 @@ class ExportConfig:
 
 
 def _candidate_string(value: Any) -> str | None:
-    if isinstance(value, str):
-        trimmed = value.strip()
-        if trimmed:
-            return trimmed
-    return None
+    return (value.strip() or None) if isinstance(value, str) else None
 
 
 def _parse_scalar(raw: str) -> Any:
@@ -50,7 +52,7 @@ def _parse_scalar(raw: str) -> Any:
         return token[1:-1]
     if token.lower() in {"true", "false"}:
         return token.lower() == "true"
-    if re.fullmatch(r"-?[0-9]+", token):
+    if _INT_RE.fullmatch(token):
         return int(token)
     return token
 
@@ -92,35 +94,51 @@ def _load_toml(task_toml: Path) -> dict[str, Any]:
 
 
 def _lookup_path(obj: Any, path: tuple[str, ...]) -> Any:
+    # TOML has no null, so None can only mean the path is absent.
     cur = obj
-    for key in path:
-        if not isinstance(cur, dict):
-            return None
-        cur = cur.get(key)
+    try:
+        for key in path:
+            cur = cur[key]
+    except (KeyError, TypeError):
+        return None
     return cur
 
 
 def _first_string(doc: dict[str, Any], paths: Iterable[tuple[str, ...]]) -> str | None:
     for path in paths:
         found = _candidate_string(_lookup_path(doc, path))
-        if found is not None:
+        if found:
             return found
     return None
 
 
 def _sanitize_task_id(raw: str, fallback: str) -> str:
-    chosen = raw.strip() if raw.strip() else fallback
-    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", chosen).strip("._-")
+    chosen = raw.strip() or fallback
+    cleaned = _TASK_ID_UNSAFE_RE.sub("_", chosen).strip("._-")
     return cleaned or fallback
 
 
+_PROMPT_SIDECARS = ("prompt.txt", "prompt.md", "task.txt", "task.md", "README.md")
+_PROMPT_SIDECAR_KEYS = frozenset(name.casefold() for name in _PROMPT_SIDECARS)
+
+
 def _read_prompt_sidecar(task_dir: Path) -> str | None:
-    candidates = ("prompt.txt", "prompt.md", "task.txt", "task.md", "README.md")
-    for name in candidates:
-        candidate = task_dir / name
-        if not candidate.is_file():
+    # One directory read instead of an is_file() stat per candidate name.
+    # Names are compared case-folded, as is_file() did on case-insensitive
+    # filesystems, preferring an exact-case match when both exist.
+    present: dict[str, str] = {}
+    with os.scandir(task_dir) as entries:
+        for entry in entries:
+            key = entry.name.casefold()
+            if key not in _PROMPT_SIDECAR_KEYS or not entry.is_file():
+                continue
+            if key not in present or entry.name in _PROMPT_SIDECARS:
+                present[key] = entry.name
+    for name in _PROMPT_SIDECARS:
+        found = present.get(name.casefold())
+        if found is None:
             continue
-        text = candidate.read_text(encoding="utf-8", errors="replace").strip()
+        text = (task_dir / found).read_text(encoding="utf-8", errors="replace").strip()
         if text:
             return text
     return None
@@ -261,7 +279,7 @@ def parse_task_dir(task_dir: Path, config: ExportConfig) -> dict[str, Any]:
 
 def _read_registry_records(path: Path) -> list[dict[str, Any]]:
     if path.suffix.lower() == ".json":
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(path.read_bytes())
         if isinstance(payload, list):
             return [row for row in payload if isinstance(row, dict)]
         if isinstance(payload, dict):
@@ -271,13 +289,14 @@ def _read_registry_records(path: Path) -> list[dict[str, Any]]:
         raise ValueError(f"unsupported registry JSON shape: {path}")
 
     records: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        trimmed = line.strip()
-        if not trimmed:
-            continue
-        row = json.loads(trimmed)
-        if isinstance(row, dict):
-            records.append(row)
+    with path.open("rb") as handle:
+        for line in handle:
+            trimmed = line.strip()
+            if not trimmed:
+                continue
+            row = json.loads(trimmed)
+            if isinstance(row, dict):
+                records.append(row)
     return records
 
 
@@ -296,37 +315,72 @@ def task_dirs_from_registry(registry_path: Path, registry_root: Path) -> list[Pa
     return sorted(out)
 
 
+def _find_task_toml_dirs(root: Path) -> list[str]:
+    """Return every directory under root that directly contains a task.toml.
+
+    Matches Path.rglob("task.toml"): any entry with that name counts, and
+    symlinked or unreadable directories are not descended into.
+    """
+    found: list[str] = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name == "task.toml":
+                        found.append(current)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return found
+
+
 def task_dirs_from_roots(roots: Iterable[Path]) -> list[Path]:
-    out: set[Path] = set()
+    out: set[str] = set()
     for root in roots:
         if not root.exists():
             continue
         if root.is_file() and root.name == "task.toml":
-            out.add(root.parent.resolve())
+            out.add(os.path.realpath(root.parent))
             continue
         if root.is_dir() and (root / "task.toml").is_file():
-            out.add(root.resolve())
+            out.add(os.path.realpath(root))
             continue
         if root.is_dir():
-            for task_toml in root.rglob("task.toml"):
-                out.add(task_toml.parent.resolve())
-    return sorted(out)
-
-
-def export_rows(task_dirs: list[Path], config: ExportConfig) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for task_dir in task_dirs:
-        try:
-            rows.append(parse_task_dir(task_dir, config))
-        except Exception as exc:
-            raise RuntimeError(f"failed parsing task dir '{task_dir}': {exc}") from exc
-    return rows
+            for task_dir in _find_task_toml_dirs(root):
+                out.add(os.path.realpath(task_dir))
+    # Sort as Paths: component-wise order differs from plain string order.
+    return sorted(map(Path, out))
+
+
+def _parse_task_dir_with_context(task_dir: Path, config: ExportConfig) -> dict[str, Any]:
+    try:
+        return parse_task_dir(task_dir, config)
+    except Exception as exc:
+        raise RuntimeError(f"failed parsing task dir '{task_dir}': {exc}") from exc
+
+
+def export_rows(
+    task_dirs: list[Path],
+    config: ExportConfig,
+    jobs: int = 1,
+) -> list[dict[str, Any]]:
+    if jobs <= 1 or len(task_dirs) < 2:
+        return [_parse_task_dir_with_context(task_dir, config) for task_dir in task_dirs]
+    chunksize = max(1, len(task_dirs) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(
+            pool.map(_parse_task_dir_with_context, task_dirs, repeat(config), chunksize=chunksize)
+        )
 
 
 def write_jsonl(path: Path, rows: Iterable[dict[str, Any]]) -> int:
     path.parent.mkdir(parents=True, exist_ok=True)
     count = 0
-    with path.open("w", encoding="utf-8") as handle:
+    # A 1 MiB buffer coalesces many small rows into few write syscalls.
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
         for row in rows:
             handle.write(json.dumps(row, separators=(",", ":")) + "\n")
             count += 1
@@ -345,6 +399,7 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("--split", default=DEFAULT_SPLIT)
     parser.add_argument("--id-prefix", default="")
     parser.add_argument("--limit", type=int, default=0, help="Optional cap after mapping.")
+    parser.add_argument("--jobs", type=int, default=1, help="Parallel worker processes for parsing task dirs.")
     parser.add_argument("--include-raw-toml", action="store_true")
     parser.add_argument(
         "--require-task-image",
@@ -394,7 +449,7 @@ def main(argv: list[str] | None = None) -> int:
         print("no Harbor tasks found (provide --tasks-root, --task-dir, or --registry-json)", file=sys.stderr)
         return 2
 
-    rows = export_rows(task_dirs, config)
+    rows = export_rows(task_dirs, config, jobs=args.jobs)
     if args.limit and args.limit > 0:
         rows = rows[: args.limit]
 
@@ -179,9 +179,15 @@ def run_external_evaluator(task_payload: Any, candidate_payload: Any) -> dict[st
         env["HARBOR_AGENT_RESULT_PATH"] = str(result_path)
         env["HARBOR_EVALUATION_OUTPUT_PATH"] = str(output_path)
 
-        proc = subprocess.run(command, capture_output=True, text=True, env=env, check=False)
+        # Capture raw bytes: stdout is parsed as JSON directly, and only
+        # decoded to text when it has to appear in an error message.
+        proc = subprocess.run(command, capture_output=True, env=env, check=False)
         if proc.returncode != 0:
-            detail = proc.stderr.strip() or proc.stdout.strip() or "evaluator returned non-zero"
+            detail = (
+                proc.stderr.decode("utf-8", "replace").strip()
+                or proc.stdout.decode("utf-8", "replace").strip()
+                or "evaluator returned non-zero"
+            )
             raise HarborAdapterError(
                 "evaluator.command_failed",
                 f"Harbor evaluator command failed: {detail}",
@@ -192,7 +198,7 @@ def run_external_evaluator(task_payload: Any, candidate_payload: Any) -> dict[st
         if stdout:
             try:
                 parsed = json.loads(stdout)
-            except json.JSONDecodeError as exc:
+            except ValueError as exc:  # JSONDecodeError or UnicodeDecodeError
                 raise HarborAdapterError(
                     "evaluator.invalid_json",
                     f"Harbor evaluator stdout is not valid JSON: {exc}",
@@ -201,7 +207,7 @@ def run_external_evaluator(task_payload: Any, candidate_payload: Any) -> dict[st
         elif output_path.exists():
             try:
                 parsed = json.loads(output_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError as exc:
+            except ValueError as exc:  # JSONDecodeError or UnicodeDecodeError
                 raise HarborAdapterError(
                     "evaluator.invalid_json",
                     f"Harbor evaluator output file is not valid JSON: {exc}",
@@ -21,13 +21,13 @@ def _coerce_non_empty_string(value: Any) -> str | None:
 
 
 def _read_path(payload: Any, path: tuple[str, ...]) -> Any:
+    # _SENTINEL rather than None: a JSON null at the path is a real value.
     current = payload
-    for key in path:
-        if not isinstance(current, dict):
-            return _SENTINEL
-        current = current.get(key, _SENTINEL)
-        if current is _SENTINEL:
-            return _SENTINEL
+    try:
+        for key in path:
+            current = current[key]
+    except (KeyError, TypeError):
+        return _SENTINEL
     return current
 
 
@@ -40,8 +40,8 @@ def _contextual_payloads(payload: Any) -> list[Any]:
     return contexts
 
 
-def _first_string(payload: Any, candidates: list[tuple[str, ...]]) -> str | None:
-    for context in _contextual_payloads(payload):
+def _first_string(contexts: list[Any], candidates: tuple[tuple[str, ...], ...]) -> str | None:
+    for context in contexts:
         for candidate in candidates:
             value = _read_path(context, candidate)
             if value is _SENTINEL:
@@ -52,6 +52,30 @@ def _first_string(payload: Any, candidates: list[tuple[str, ...]]) -> str | None
     return None
 
 
+_BASE_PATHS: tuple[tuple[str, tuple[tuple[str, ...], ...]], ...] = (
+    ("repo", (
+        ("task", "swebench", "input", "repo"),
+        ("swebench", "input", "repo"),
+    )),
+    ("base_commit", (
+        ("task", "swebench", "input", "base_commit"),
+        ("swebench", "input", "base_commit"),
+    )),
+    ("instance_id", (
+        ("task", "swebench", "input", "instance_id"),
+        ("swebench", "input", "instance_id"),
+        ("task", "input", "instance_id"),
+        ("input", "instance_id"),
+    )),
+    ("problem_statement", (
+        ("task", "swebench", "input", "problem_statement"),
+        ("swebench", "input", "problem_statement"),
+        ("task", "input", "problem_statement"),
+        ("input", "problem_statement"),
+    )),
+)
+
+
 def extract_swebench_meta(payload: Any) -> dict[str, str | None]:
     """Extract SWE-bench metadata from known payload shapes.
 
@@ -61,28 +85,7 @@ def extract_swebench_meta(payload: Any) -> dict[str, str | None]:
     - instance_id fallbacks: task.input.instance_id, input.instance_id
     """
 
-    base_paths = {
-        "repo": [
-            ("task", "swebench", "input", "repo"),
-            ("swebench", "input", "repo"),
-        ],
-        "base_commit": [
-            ("task", "swebench", "input", "base_commit"),
-            ("swebench", "input", "base_commit"),
-        ],
-        "instance_id": [
-            ("task", "swebench", "input", "instance_id"),
-            ("swebench", "input", "instance_id"),
-            ("task", "input", "instance_id"),
-            ("input", "instance_id"),
-        ],
-        "problem_statement": [
-            ("task", "swebench", "input", "problem_statement"),
-            ("swebench", "input", "problem_statement"),
-            ("task", "input", "problem_statement"),
-            ("input", "problem_statement"),
-        ],
-    }
+    contexts = _contextual_payloads(payload)
     return {
-        key: _first_string(payload, candidates) for key, candidates in base_paths.items()
+        key: _first_string(contexts, candidates) for key, candidates in _BASE_PATHS
     }
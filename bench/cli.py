@@ -36,13 +36,19 @@ def main(ctx: click.Context) -> None:
 
 
 @main.command("validate-schemas")
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Meta-validate every schema, ignoring digests of previously passing schemas",
+)
 @click.pass_context
-def validate_schemas(ctx: click.Context) -> None:
+def validate_schemas(ctx: click.Context, no_cache: bool) -> None:
     """Validate all schemas in schemas/."""
     from bench.taskkit.schema import validate_all_schemas
 
     cfg = ctx.obj["config"]
-    errors = validate_all_schemas(cfg.schemas_dir)
+    cache_path = None if no_cache else cfg.cache_dir / "schema_check.json"
+    errors = validate_all_schemas(cfg.schemas_dir, cache_path=cache_path)
     if errors:
         for e in errors:
             click.echo(f"FAIL: {e}", err=True)
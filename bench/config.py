@@ -18,6 +18,7 @@ class BenchConfig:
     tasks_dir: Path = field(init=False)
     runs_dir: Path = field(init=False)
     reports_dir: Path = field(init=False)
+    cache_dir: Path = field(init=False)
     scripts_dir: Path = field(init=False)
 
     def __post_init__(self) -> None:
@@ -28,6 +29,7 @@ class BenchConfig:
         object.__setattr__(self, "tasks_dir", self.benchmark_dir / "tasks")
         object.__setattr__(self, "runs_dir", self.benchmark_dir / "runs")
         object.__setattr__(self, "reports_dir", self.benchmark_dir / "reports")
+        object.__setattr__(self, "cache_dir", self.benchmark_dir / "cache")
         object.__setattr__(self, "scripts_dir", self.root / "scripts")
 
     @classmethod
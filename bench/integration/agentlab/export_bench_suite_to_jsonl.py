@@ -9,12 +9,19 @@ import json
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from bench.taskkit.schema import _SafeLoader
+
 DEFAULT_SUITE = "v0"
 DEFAULT_SPLIT = "test"
 DEFAULT_BENCHMARK_NAME = "bench"
@@ -98,7 +105,7 @@ def _load_task_yaml(task_dir: Path) -> dict[str, Any]:
     task_yaml = task_dir / "task.yaml"
     if not task_yaml.exists():
         raise FileNotFoundError(f"missing task.yaml: {task_yaml}")
-    payload = yaml.safe_load(task_yaml.read_text(encoding="utf-8"))
+    payload = yaml.load(task_yaml.read_text(encoding="utf-8"), Loader=_SafeLoader)
     if not isinstance(payload, dict):
         raise ValueError(f"task.yaml must decode to an object: {task_yaml}")
     return payload
@@ -408,9 +415,15 @@ def _build_task_row(
 
 
 def _iter_task_dirs(suite_dir: Path) -> list[Path]:
-    return sorted(
-        p for p in suite_dir.iterdir() if p.is_dir() and p.name.startswith("TASK")
-    )
+    # DirEntry.is_dir() answers from the directory read's d_type, so only
+    # symlinked entries cost an extra stat.
+    with os.scandir(suite_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.startswith("TASK") and entry.is_dir()
+        )
+    return [suite_dir / name for name in names]
 
 
 def main() -> int:
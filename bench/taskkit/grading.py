@@ -75,11 +75,13 @@ def _compute_score(
 
 
 def _apply_patch_text(workspace: Path, patch_text: str) -> bool:
+    # Only the exit status is used: encode the patch once and drop the output.
+    patch_bytes = patch_text.encode("utf-8")
     result = subprocess.run(
-        ["git", "apply", "--verbose", "-"],
-        input=patch_text,
-        capture_output=True,
-        text=True,
+        ["git", "apply", "-"],
+        input=patch_bytes,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         cwd=str(workspace),
         timeout=30,
     )
@@ -87,9 +89,9 @@ def _apply_patch_text(workspace: Path, patch_text: str) -> bool:
         return True
     result2 = subprocess.run(
         ["patch", "-p1", "--batch", "--forward"],
-        input=patch_text,
-        capture_output=True,
-        text=True,
+        input=patch_bytes,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         cwd=str(workspace),
         timeout=30,
     )
@@ -152,10 +154,12 @@ def grade_patch_for_task_data(
         public_cmd = str(task_data.get("public_command", "") or "")
         if public_cmd:
             try:
+                # Only the exit status matters; discard output rather than
+                # buffering an unbounded amount of it in memory.
                 pub_result = subprocess.run(
                     ["bash", "-c", public_cmd],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     cwd=str(workspace),
                     timeout=int(task_data.get("time_limits", {}).get("public_timeout", 30)),
                 )
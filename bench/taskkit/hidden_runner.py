@@ -100,7 +100,7 @@ def run_hidden_suite(
     # Clean HOME
     env["HOME"] = str(hidden_dir.parent)
 
-    start = time.monotonic()
+    start = time.perf_counter_ns()
     try:
         proc = subprocess.run(
             [sys.executable, str(runner_py), str(workspace), str(cases_jsonl)],
@@ -110,9 +110,9 @@ def run_hidden_suite(
             env=env,
             cwd=str(workspace),
         )
-        duration_ms = (time.monotonic() - start) * 1000
+        duration_ms = (time.perf_counter_ns() - start) / 1_000_000
     except subprocess.TimeoutExpired as e:
-        duration_ms = (time.monotonic() - start) * 1000
+        duration_ms = (time.perf_counter_ns() - start) / 1_000_000
         return HiddenSuiteResult(
             timed_out=True,
             duration_ms=duration_ms,
@@ -122,8 +122,8 @@ def run_hidden_suite(
     # Parse results from stdout (JSONL format)
     case_results: list[CaseResult] = []
     for line in proc.stdout.splitlines():
-        line = line.strip()
-        if not line:
+        # json.loads tolerates surrounding whitespace; skip only blank lines.
+        if not line or line.isspace():
             continue
         try:
             record = json.loads(line)
@@ -5,9 +5,13 @@ Standardizes how tasks inject bugs/features into repo snapshots.
 
 from __future__ import annotations
 
+import fnmatch
 import hashlib
+import re
 import subprocess
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -39,10 +43,10 @@ def validate_injection_patch(
 
     # Check against deny patterns
     if deny_patterns:
-        import fnmatch
+        compiled = [(pattern, re.compile(fnmatch.translate(pattern))) for pattern in deny_patterns]
         for fpath in files:
-            for pattern in deny_patterns:
-                if fnmatch.fnmatch(fpath, pattern):
+            for pattern, pattern_re in compiled:
+                if pattern_re.match(fpath):
                     errors.append(
                         f"Injection patch modifies denylisted file: {fpath} "
                         f"(matches {pattern})"
@@ -50,6 +54,41 @@ def validate_injection_patch(
     return errors
 
 
+@dataclass
+class PatchManifest:
+    """Manifest of an injection patch.
+
+    ``patch_hash`` is computed on first access, so callers that only need
+    ``files_changed`` never hash the patch text.
+    """
+    patch_file: str
+    files_changed: list[str]
+    patch_text: InitVar[str]
+    source_snapshot_id: str | None = None
+    created_at: str | None = None
+    tree_hash_before: str | None = None
+    tree_hash_after: str | None = None
+    _text_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self, patch_text: str) -> None:
+        self._text_bytes = patch_text.encode()
+
+    @cached_property
+    def patch_hash(self) -> str:
+        return hashlib.sha256(self._text_bytes).hexdigest()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "patch_file": self.patch_file,
+            "files_changed": self.files_changed,
+            "patch_hash": self.patch_hash,
+            "source_snapshot_id": self.source_snapshot_id,
+            "created_at": self.created_at,
+            "tree_hash_before": self.tree_hash_before,
+            "tree_hash_after": self.tree_hash_after,
+        }
+
+
 def get_injection_manifest(
     patch_path: Path,
     source_snapshot_id: str | None = None,
@@ -57,18 +96,20 @@ def get_injection_manifest(
     tree_hash_after: str | None = None,
     created_at: str | None = None,
 ) -> dict[str, Any]:
-    """Get a manifest of files changed by an injection patch."""
+    """Get a manifest of files changed by an injection patch.
+
+    Build a ``PatchManifest`` directly to skip hashing the patch.
+    """
     patch_text = patch_path.read_text()
-    files = parse_patch_files(patch_text)
-    return {
-        "patch_file": str(patch_path),
-        "files_changed": files,
-        "patch_hash": hashlib.sha256(patch_text.encode()).hexdigest(),
-        "source_snapshot_id": source_snapshot_id,
-        "created_at": created_at or datetime.now(timezone.utc).isoformat(),
-        "tree_hash_before": tree_hash_before,
-        "tree_hash_after": tree_hash_after,
-    }
+    return PatchManifest(
+        patch_file=str(patch_path),
+        files_changed=parse_patch_files(patch_text),
+        patch_text=patch_text,
+        source_snapshot_id=source_snapshot_id,
+        created_at=created_at or datetime.now(timezone.utc).isoformat(),
+        tree_hash_before=tree_hash_before,
+        tree_hash_after=tree_hash_after,
+    ).to_dict()
 
 
 def apply_injection(
@@ -85,7 +126,7 @@ def apply_injection(
     tree_hash_before = compute_workspace_tree_hash(workspace)
 
     result = subprocess.run(
-        ["git", "apply", "--verbose", "-"],
+        ["git", "apply", "-"],
         input=patch_text,
         capture_output=True,
         text=True,
@@ -118,9 +159,13 @@ def apply_injection(
 
 
 def compute_workspace_tree_hash(workspace: Path) -> str:
-    """Compute a deterministic hash of the workspace file tree."""
+    """Compute a deterministic hash of the workspace file tree.
+
+    The digest is BLAKE2b-256, prefixed with ``b2:`` so it never compares
+    equal to tree hashes from the earlier SHA-256 format.
+    """
     import os
-    h = hashlib.sha256()
+    h = hashlib.blake2b(digest_size=32)
     for root, dirs, files in os.walk(workspace):
         dirs.sort()
         for fname in sorted(files):
@@ -128,4 +173,4 @@ def compute_workspace_tree_hash(workspace: Path) -> str:
             relpath = fpath.relative_to(workspace).as_posix()
             h.update(relpath.encode())
             h.update(fpath.read_bytes())
-    return h.hexdigest()
+    return "b2:" + h.hexdigest()
@@ -6,28 +6,40 @@ and repo snapshot.
 
 from __future__ import annotations
 
+import functools
 import json
 import shutil
 import subprocess
-import tempfile
 from pathlib import Path
 from typing import Any
 
 from bench.config import BenchConfig
+from bench.taskkit.patch_utils import THROWAWAY_GIT_ARGS
 
 
 def load_task(task_dir: Path, config: BenchConfig) -> dict[str, Any]:
     """Load and validate a task from its directory."""
-    from bench.taskkit.schema import load_task_yaml, load_schema, validate_json
+    from bench.taskkit.schema import is_valid, load_task_yaml, load_schema, validate_json
 
     task_data = load_task_yaml(task_dir)
     schema = load_schema(config.schemas_dir / "task.schema.json")
-    errors = validate_json(task_data, schema)
-    if errors:
+    if not is_valid(task_data, schema):
+        errors = validate_json(task_data, schema)
         raise ValueError(f"Task validation failed for {task_dir}:\n" + "\n".join(errors))
     return task_data
 
 
+@functools.lru_cache(maxsize=1)
+def _zstd_available() -> bool:
+    """Return whether a standalone ``zstd`` binary is on PATH (checked once)."""
+    try:
+        return subprocess.run(
+            ["zstd", "-V"], capture_output=True, timeout=10,
+        ).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
 def unpack_repo_snapshot(
     repo_id: str,
     config: BenchConfig,
@@ -41,9 +53,13 @@ def unpack_repo_snapshot(
     target_dir.mkdir(parents=True, exist_ok=True)
 
     # Try zstd decompression + tar extraction
+    if _zstd_available():
+        tar_cmd = ["tar", "-I", "zstd -T0 -d", "-xf", str(archive), "-C", str(target_dir)]
+    else:
+        tar_cmd = ["tar", "--zstd", "-xf", str(archive), "-C", str(target_dir)]
     try:
         subprocess.run(
-            ["tar", "--zstd", "-xf", str(archive), "-C", str(target_dir)],
+            tar_cmd,
             check=True,
             capture_output=True,
             timeout=120,
@@ -52,7 +68,7 @@ def unpack_repo_snapshot(
         # Fallback: try with zstd pipe
         try:
             zstd = subprocess.Popen(
-                ["zstd", "-d", "-c", str(archive)],
+                ["zstd", "-d", "-T0", "-c", str(archive)],
                 stdout=subprocess.PIPE,
             )
             subprocess.run(
@@ -66,6 +82,27 @@ def unpack_repo_snapshot(
             raise RuntimeError(f"Cannot decompress {archive}: install zstd or tar with zstd support")
 
 
+def _init_git_baseline(workspace: Path, home: Path) -> None:
+    """Commit the workspace contents as the ``baseline`` git revision.
+
+    Runs exactly three git processes: init, add, and commit.
+    """
+    subprocess.run(["git", "init", "-q"], cwd=str(workspace), capture_output=True, timeout=10)
+    # The throwaway settings are passed per command and never written to
+    # .git/config, so the agent and grading tools see a stock repository.
+    subprocess.run(
+        ["git", *THROWAWAY_GIT_ARGS, "add", "-A", "."],
+        cwd=str(workspace), capture_output=True, timeout=30,
+    )
+    subprocess.run(
+        ["git", *THROWAWAY_GIT_ARGS, "commit", "-q", "-m", "baseline", "--allow-empty"],
+        cwd=str(workspace), capture_output=True, timeout=30,
+        env={"GIT_AUTHOR_NAME": "bench", "GIT_AUTHOR_EMAIL": "bench@bench",
+             "GIT_COMMITTER_NAME": "bench", "GIT_COMMITTER_EMAIL": "bench@bench",
+             "HOME": str(home), "PATH": "/usr/bin:/bin:/usr/local/bin"},
+    )
+
+
 def apply_injection_patch(
     workspace: Path,
     task_dir: Path,
@@ -76,12 +113,12 @@ def apply_injection_patch(
     if not patch_file.exists():
         raise FileNotFoundError(f"Injection patch not found: {patch_file}")
 
-    patch_text = patch_file.read_text()
+    # Feed the patch to git as raw bytes; only stderr is decoded, on failure.
+    patch_bytes = patch_file.read_bytes()
     result = subprocess.run(
-        ["git", "apply", "--verbose", "-"],
-        input=patch_text,
+        ["git", "apply", "-"],
+        input=patch_bytes,
         capture_output=True,
-        text=True,
         cwd=str(workspace),
         timeout=30,
     )
@@ -89,15 +126,16 @@ def apply_injection_patch(
         # Try plain patch
         result2 = subprocess.run(
             ["patch", "-p1", "--batch", "--forward"],
-            input=patch_text,
+            input=patch_bytes,
             capture_output=True,
-            text=True,
             cwd=str(workspace),
             timeout=30,
         )
         if result2.returncode != 0:
+            git_err = result.stderr.decode("utf-8", "replace")
+            patch_err = result2.stderr.decode("utf-8", "replace")
             raise RuntimeError(
-                f"Failed to apply injection patch:\ngit: {result.stderr}\npatch: {result2.stderr}"
+                f"Failed to apply injection patch:\ngit: {git_err}\npatch: {patch_err}"
             )
 
 
@@ -122,15 +160,7 @@ def prepare_agent_workspace(
     unpack_repo_snapshot(task_data["repo_id"], config, workspace)
 
     # 2. Init git for patch application
-    subprocess.run(["git", "init"], cwd=str(workspace), capture_output=True, timeout=10)
-    subprocess.run(["git", "add", "."], cwd=str(workspace), capture_output=True, timeout=30)
-    subprocess.run(
-        ["git", "commit", "-m", "baseline", "--allow-empty"],
-        cwd=str(workspace), capture_output=True, timeout=30,
-        env={"GIT_AUTHOR_NAME": "bench", "GIT_AUTHOR_EMAIL": "bench@bench",
-             "GIT_COMMITTER_NAME": "bench", "GIT_COMMITTER_EMAIL": "bench@bench",
-             "HOME": str(work_root), "PATH": "/usr/bin:/bin:/usr/local/bin"},
-    )
+    _init_git_baseline(workspace, work_root)
 
     # 3. Apply injection patch
     apply_injection_patch(workspace, task_dir, task_data["baseline_injection_patch"])
@@ -184,15 +214,7 @@ def prepare_grader_workspace(
     unpack_repo_snapshot(task_data["repo_id"], config, workspace)
 
     # 2. Init git
-    subprocess.run(["git", "init"], cwd=str(workspace), capture_output=True, timeout=10)
-    subprocess.run(["git", "add", "."], cwd=str(workspace), capture_output=True, timeout=30)
-    subprocess.run(
-        ["git", "commit", "-m", "baseline", "--allow-empty"],
-        cwd=str(workspace), capture_output=True, timeout=30,
-        env={"GIT_AUTHOR_NAME": "bench", "GIT_AUTHOR_EMAIL": "bench@bench",
-             "GIT_COMMITTER_NAME": "bench", "GIT_COMMITTER_EMAIL": "bench@bench",
-             "HOME": str(work_root), "PATH": "/usr/bin:/bin:/usr/local/bin"},
-    )
+    _init_git_baseline(workspace, work_root)
 
     # 3. Apply injection patch
     apply_injection_patch(workspace, task_dir, task_data["baseline_injection_patch"])
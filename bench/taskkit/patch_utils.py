@@ -5,18 +5,39 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+# Settings for building the baseline commit of benchmark-owned throwaway
+# repos, where durability is irrelevant: skip index checksums and fsyncs,
+# and never run background gc. Pass them with -c only; they are not
+# written to the workspace's .git/config.
+THROWAWAY_GIT_CONFIG: tuple[tuple[str, str], ...] = (
+    ("index.skipHash", "true"),
+    ("index.version", "4"),
+    ("core.fsync", "none"),
+    ("gc.auto", "0"),
+    ("core.preloadIndex", "true"),
+)
+THROWAWAY_GIT_ARGS: tuple[str, ...] = tuple(
+    arg for key, value in THROWAWAY_GIT_CONFIG for arg in ("-c", f"{key}={value}")
+)
+
+
+_PATCH_FILE_RE = re.compile(
+    r"(?:\+\+\+|---)\s+[ab]/(?P<path>.+)|diff --git a/(?P<old>.+?) b/(?P<new>.+)"
+)
+
 
 def parse_patch_files(patch_text: str) -> list[str]:
     """Extract workspace-relative file paths touched by a unified diff patch."""
     files: set[str] = set()
     for line in patch_text.splitlines():
-        m = re.match(r"^(?:\+\+\+|---)\s+[ab]/(.+)", line)
-        if m:
-            files.add(m.group(1))
-        m = re.match(r"^diff --git a/(.+?) b/(.+)", line)
-        if m:
-            files.add(m.group(1))
-            files.add(m.group(2))
+        m = _PATCH_FILE_RE.match(line)
+        if m is None:
+            continue
+        if m["path"] is not None:
+            files.add(m["path"])
+        else:
+            files.add(m["old"])
+            files.add(m["new"])
     return sorted(files)
 
 
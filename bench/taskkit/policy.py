@@ -3,25 +3,38 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
+import re
 from pathlib import Path
 from typing import Any
 
 from bench.paths import HARNESS_DENY_PATTERNS, REPO_CONFIG_DENY_PATTERNS
 
 
+@functools.lru_cache(maxsize=512)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a policy glob into a single anchored regex.
+
+    A pattern with one ``**`` matches paths that start with the literal
+    prefix before it and whose remainder (or full path) matches the glob
+    after it; anything else falls back to plain ``fnmatch`` semantics.
+    """
+    parts = pattern.split("**")
+    if len(parts) != 2:
+        return re.compile(fnmatch.translate(pattern))
+    prefix = parts[0].rstrip("/")
+    suffix = parts[1].lstrip("/")
+    head = f"(?={re.escape(prefix.rstrip('*'))})" if prefix else ""
+    if not suffix:
+        return re.compile(head)
+    suffix_re = fnmatch.translate(suffix)
+    if not prefix:
+        return re.compile(suffix_re)
+    return re.compile(f"(?s){head}(?:.{{{len(prefix)}}}/*+{suffix_re}|{suffix_re})")
+
+
 def _glob_match(filepath: str, pattern: str) -> bool:
-    if "**" in pattern:
-        parts = pattern.split("**")
-        if len(parts) == 2:
-            prefix = parts[0].rstrip("/")
-            suffix = parts[1].lstrip("/")
-            if prefix and not filepath.startswith(prefix.rstrip("*")):
-                return False
-            if suffix:
-                remaining = filepath[len(prefix):].lstrip("/") if prefix else filepath
-                return fnmatch.fnmatch(remaining, suffix) or fnmatch.fnmatch(filepath, suffix)
-            return True
-    return fnmatch.fnmatch(filepath, pattern)
+    return _compile_glob(pattern).match(filepath) is not None
 
 
 class PatchPolicy:
@@ -47,15 +60,17 @@ class PatchPolicy:
 
     def check_files(self, files: list[str]) -> list[str]:
         violations: list[str] = []
+        deny = [(pattern, _compile_glob(pattern)) for pattern in self.deny_edit_globs]
+        allow = [_compile_glob(pattern) for pattern in self.allow_edit_globs]
         for fpath in files:
-            for pattern in self.deny_edit_globs:
-                if _glob_match(fpath, pattern):
+            for pattern, pattern_re in deny:
+                if pattern_re.match(fpath):
                     violations.append(
                         f"POLICY_VIOLATION: '{fpath}' matches deny pattern '{pattern}'"
                     )
                     break
             else:
-                allowed = any(_glob_match(fpath, pattern) for pattern in self.allow_edit_globs)
+                allowed = any(pattern_re.match(fpath) for pattern_re in allow)
                 if not allowed:
                     violations.append(
                         f"POLICY_VIOLATION: '{fpath}' does not match any allow pattern"
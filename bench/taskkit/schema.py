@@ -2,33 +2,94 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+from importlib.metadata import version
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+@functools.lru_cache(maxsize=16)
+def _load_schema_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    return json.loads(Path(path_str).read_bytes())
+
 
 def load_schema(schema_path: Path) -> dict[str, Any]:
-    """Load a JSON Schema file."""
-    return json.loads(schema_path.read_text())
+    """Load a JSON Schema file.
+
+    Results are cached by (path, mtime, size), so repeated loads share one
+    dict; treat it as read-only.
+    """
+    st = schema_path.stat()
+    return _load_schema_cached(str(schema_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+# Compiled validators, keyed first by schema object identity (the entry pins
+# the schema so its id cannot be reused) and then by schema content, so dicts
+# re-loaded from disk still share one validator. Schemas must not be mutated
+# after their first validation.
+_VALIDATOR_CACHE: dict[int, tuple[dict[str, Any], jsonschema.Draft202012Validator]] = {}
+_VALIDATOR_CACHE_BY_CONTENT: dict[bytes, jsonschema.Draft202012Validator] = {}
+_VALIDATOR_CACHE_MAX = 64
+
+
+def _canonical_json_bytes(value: Any) -> bytes:
+    """Serialize with sorted keys; only stable within one process's cache."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _get_cached_validator(schema: dict[str, Any]) -> jsonschema.Draft202012Validator:
+    """Return a reusable Draft 2020-12 validator for a schema."""
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    digest = hashlib.blake2b(_canonical_json_bytes(schema), digest_size=16).digest()
+    validator = _VALIDATOR_CACHE_BY_CONTENT.get(digest)
+    if validator is None:
+        if len(_VALIDATOR_CACHE_BY_CONTENT) >= _VALIDATOR_CACHE_MAX:
+            _VALIDATOR_CACHE_BY_CONTENT.clear()
+        validator = jsonschema.Draft202012Validator(schema)
+        _VALIDATOR_CACHE_BY_CONTENT[digest] = validator
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_MAX:
+        _VALIDATOR_CACHE.clear()
+    _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
+
+
+def _format_error(error: jsonschema.ValidationError) -> str:
+    return f"{'.'.join(map(str, error.absolute_path)) or '<root>'}: {error.message}"
+
+
+def _collect_errors(validator: jsonschema.Draft202012Validator, data: Any) -> list[str]:
+    errors = list(validator.iter_errors(data))
+    errors.sort(key=lambda e: tuple(e.path))
+    return [_format_error(e) for e in errors]
 
 
 def validate_json(data: dict[str, Any], schema: dict[str, Any]) -> list[str]:
     """Validate data against a JSON schema. Returns list of error messages."""
-    validator = jsonschema.Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(data), key=lambda e: list(e.path))
-    return [
-        f"{'.'.join(str(p) for p in e.absolute_path) or '<root>'}: {e.message}"
-        for e in errors
-    ]
+    return _collect_errors(_get_cached_validator(schema), data)
+
+
+def is_valid(data: Any, schema: dict[str, Any]) -> bool:
+    """Return whether data satisfies a JSON schema, stopping at the first error."""
+    return _get_cached_validator(schema).is_valid(data)
 
 
 def validate_task_yaml(task_yaml_path: Path, schema_path: Path) -> list[str]:
     """Validate a task.yaml file against the task schema."""
     with open(task_yaml_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
     schema = load_schema(schema_path)
     return validate_json(data, schema)
 
@@ -43,9 +104,29 @@ def validate_score(score: dict[str, Any], schema: dict[str, Any]) -> list[str]:
     return validate_json(score, schema)
 
 
-def validate_all_schemas(schemas_dir: Path) -> list[str]:
+@functools.lru_cache(maxsize=1)
+def _jsonschema_version() -> str:
+    return version("jsonschema")
+
+
+def _load_schema_check_cache(cache_path: Path) -> dict[str, str]:
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("jsonschema") != _jsonschema_version():
+        return {}
+    digests = cache.get("schemas")
+    return digests if isinstance(digests, dict) else {}
+
+
+def validate_all_schemas(schemas_dir: Path, cache_path: Path | None = None) -> list[str]:
     """Validate that all benchmark schemas are well-formed JSON Schema documents.
 
+    When ``cache_path`` is given, schemas whose bytes match a digest recorded
+    there by a previous passing run (under the same jsonschema version) skip
+    the meta-schema check, and the file is refreshed with the current set.
+
     Returns a list of error messages (empty if all valid).
     """
     errors: list[str] = []
@@ -57,10 +138,17 @@ def validate_all_schemas(schemas_dir: Path) -> list[str]:
     )
     if not schema_paths:
         return [f"No schema files found in {schemas_dir}"]
+    trusted = _load_schema_check_cache(cache_path) if cache_path is not None else {}
+    checked: dict[str, str] = {}
     for path in schema_paths:
         name = path.name
+        raw = path.read_bytes()
+        digest = hashlib.blake2b(raw).hexdigest()
+        if trusted.get(name) == digest:
+            checked[name] = digest
+            continue
         try:
-            schema = json.loads(path.read_text())
+            schema = json.loads(raw)
         except json.JSONDecodeError as e:
             errors.append(f"Invalid JSON in {name}: {e}")
             continue
@@ -70,6 +158,20 @@ def validate_all_schemas(schemas_dir: Path) -> list[str]:
             jsonschema.Draft202012Validator.check_schema(schema)
         except jsonschema.SchemaError as e:
             errors.append(f"Invalid schema {name}: {e.message}")
+            continue
+        checked[name] = digest
+    if cache_path is not None and checked != trusted:
+        # The cache only saves work on the next run; failing to write it
+        # must not fail validation.
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(
+                {"jsonschema": _jsonschema_version(), "schemas": checked},
+                indent=2,
+                sort_keys=True,
+            ))
+        except OSError:
+            pass
     return errors
 
 
@@ -88,8 +190,9 @@ def validate_and_write_json(
     out_path: Path,
 ) -> None:
     """Validate JSON data against schema and write deterministically."""
-    errors = validate_with_schema_file(data, schema_path)
-    if errors:
+    schema = load_schema(schema_path)
+    if not is_valid(data, schema):
+        errors = validate_json(data, schema)
         raise ValueError(
             f"Schema validation failed for {out_path} using {schema_path.name}: "
             + "; ".join(errors)
@@ -104,4 +207,4 @@ def load_task_yaml(task_dir: Path) -> dict[str, Any]:
     if not task_yaml.exists():
         raise FileNotFoundError(f"task.yaml not found in {task_dir}")
     with open(task_yaml) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
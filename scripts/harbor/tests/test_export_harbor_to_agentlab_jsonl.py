@@ -66,6 +66,20 @@ class HarborExporterTests(unittest.TestCase):
             )
             self.assertEqual(row["task"]["input"]["prompt"], "Diagnose and patch bug")
 
+    def test_prompt_sidecar_names_match_case_insensitively(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            task_dir = root / "task_readme_sidecar"
+            task_dir.mkdir(parents=True)
+            (task_dir / "task.toml").write_text('id = "tb2_readme"\n', encoding="utf-8")
+            (task_dir / "readme.md").write_text("Fix the lowercase readme task\n", encoding="utf-8")
+
+            row = exporter.parse_task_dir(
+                task_dir,
+                exporter.ExportConfig(default_task_image="python:3.11-slim"),
+            )
+            self.assertEqual(row["task"]["input"]["prompt"], "Fix the lowercase readme task")
+
     def test_require_task_image_fails_when_missing(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -115,6 +129,46 @@ class HarborExporterTests(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, "task.workspace is not supported"):
                 exporter.parse_task_dir(task_dir, exporter.ExportConfig())
 
+    def test_export_rows_parallel_preserves_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            task_dirs = []
+            for idx in range(5):
+                task_dir = root / f"task_{idx}"
+                task_dir.mkdir(parents=True)
+                (task_dir / "task.toml").write_text(f'id = "tb2_{idx}"\n', encoding="utf-8")
+                task_dirs.append(task_dir)
+            config = exporter.ExportConfig(default_task_image="python:3.11-slim")
+
+            serial = exporter.export_rows(task_dirs, config)
+            parallel = exporter.export_rows(task_dirs, config, jobs=2)
+
+            self.assertEqual(parallel, serial)
+            self.assertEqual([row["task"]["id"] for row in parallel], [f"tb2_{i}" for i in range(5)])
+
+    def test_task_dirs_from_roots_matches_rglob(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve()
+            suite = root / "suite"
+            for rel in ("a", "b/c", "b/c/d", ".hidden"):
+                (suite / rel).mkdir(parents=True)
+                (suite / rel / "task.toml").write_text('id = "x"\n', encoding="utf-8")
+            (root / "other").mkdir()
+            (root / "other" / "task.toml").write_text('id = "other"\n', encoding="utf-8")
+            (suite / "linked_dir").symlink_to(root / "other", target_is_directory=True)
+            (suite / "linked_file").mkdir()
+            (suite / "linked_file" / "task.toml").symlink_to(suite / "a" / "task.toml")
+            (suite / "dir_named_toml" / "task.toml").mkdir(parents=True)
+
+            found = exporter.task_dirs_from_roots([suite])
+
+            expected = [
+                suite / rel
+                for rel in (".hidden", "a", "b/c", "b/c/d", "dir_named_toml", "linked_file")
+            ]
+            self.assertEqual(found, sorted(expected))
+            self.assertEqual(found, sorted({p.parent.resolve() for p in suite.rglob("task.toml")}))
+
     def test_write_jsonl_emits_one_record_per_line(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             output = Path(tmp) / "out.jsonl"
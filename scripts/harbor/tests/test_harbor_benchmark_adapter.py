@@ -110,6 +110,15 @@ class HarborBenchmarkAdapterTests(unittest.TestCase):
         self.assertEqual(conclusion["payload"]["evaluator"]["name"], "harbor_official")
         self.assertEqual(conclusion["payload"]["evaluator"]["mode"], "official")
 
+    def test_non_utf8_evaluator_stdout_raises_invalid_json(self) -> None:
+        cmd = [sys.executable, "-c", "import sys;sys.stdout.buffer.write(b'{\\xff')"]
+        os.environ["HARBOR_EVALUATOR_CMD_JSON"] = json.dumps(cmd)
+
+        with self.assertRaises(adapter.HarborAdapterError) as ctx:
+            adapter.run_external_evaluator({"id": "tb2_task_1"}, {"outcome": True})
+        self.assertEqual(ctx.exception.code, "evaluator.invalid_json")
+        self.assertEqual(ctx.exception.exit_code, 24)
+
     def test_invalid_evaluator_cmd_json_raises_structured_error(self) -> None:
         os.environ["HARBOR_EVALUATOR_CMD_JSON"] = "{invalid"
         with self.assertRaises(adapter.HarborAdapterError) as ctx: